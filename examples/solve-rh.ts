@@ -79,5 +79,7 @@ async function solveRiemannHypothesis() {
   console.log('═══════════════════════════════════════════════════════════════\n');
 }
 
-// Execute
-solveRiemannHypothesis().catch(console.error);
+// Execute only when run directly, not when imported
+if (require.main === module) {
+  solveRiemannHypothesis().catch(console.error);
+}
@@ -100,32 +100,37 @@ async function runAxiomPrimeTests() {
 }
 
 function printResult(result: any) {
-  console.log('┌─ Answer:', result.answer);
-  console.log('├─ Invariant:', result.invariantUsed);
-  console.log('├─ Steps:');
+  // Collect the block and write it once instead of one console.log per line
+  const lines: string[] = [];
+  lines.push(`┌─ Answer: ${result.answer}`);
+  lines.push(`├─ Invariant: ${result.invariantUsed}`);
+  lines.push('├─ Steps:');
   result.steps.forEach((step: string) => {
-    console.log(`│  ${step}`);
+    lines.push(`│  ${step}`);
   });
   if (result.metadata?.formulaUsed) {
-    console.log('├─ Formula:', result.metadata.formulaUsed);
+    lines.push(`├─ Formula: ${result.metadata.formulaUsed}`);
   }
   if (result.metadata?.intermediateValues) {
-    console.log('├─ Key Values:');
+    lines.push('├─ Key Values:');
     const values = result.metadata.intermediateValues;
     for (const [key, value] of Object.entries(values)) {
       if (typeof value === 'number') {
-        console.log(`│    ${key}: ${(value as number).toFixed ? (value as number).toFixed(6) : value}`);
+        lines.push(`│    ${key}: ${(value as number).toFixed ? (value as number).toFixed(6) : value}`);
       } else {
-        console.log(`│    ${key}: ${value}`);
+        lines.push(`│    ${key}: ${value}`);
       }
     }
   }
-  console.log('└─ Logs:');
+  lines.push('└─ Logs:');
   result.logs.forEach((log: any) => {
     const icon = log.type === 'success' ? '✓' : log.type === 'warning' ? '⚠' : log.type === 'error' ? '✗' : 'ℹ';
-    console.log(`   ${icon} ${log.message}`);
+    lines.push(`   ${icon} ${log.message}`);
   });
+  console.log(lines.join('\n'));
 }
 
-// Run tests
-runAxiomPrimeTests().catch(console.error);
+// Run tests only when run directly, not when imported
+if (require.main === module) {
+  runAxiomPrimeTests().catch(console.error);
+}
@@ -133,21 +133,26 @@ async function runTests() {
 }
 
 function printResult(result: any) {
-  console.log('├─ Answer:', result.answer);
-  console.log('├─ Invariant:', result.invariantUsed);
-  console.log('├─ Steps:');
+  // Collect the block and write it once instead of one console.log per line
+  const lines: string[] = [];
+  lines.push(`├─ Answer: ${result.answer}`);
+  lines.push(`├─ Invariant: ${result.invariantUsed}`);
+  lines.push('├─ Steps:');
   result.steps.forEach((step: string, i: number) => {
-    console.log(`│  ${i + 1}. ${step}`);
+    lines.push(`│  ${i + 1}. ${step}`);
   });
   if (result.metadata?.formulaUsed) {
-    console.log('├─ Formula:', result.metadata.formulaUsed);
+    lines.push(`├─ Formula: ${result.metadata.formulaUsed}`);
   }
-  console.log('└─ Logs:');
+  lines.push('└─ Logs:');
   result.logs.forEach((log: any) => {
     const icon = log.type === 'success' ? '✓' : log.type === 'warning' ? '⚠' : log.type === 'error' ? '✗' : 'ℹ';
-    console.log(`   ${icon} ${log.message}`);
+    lines.push(`   ${icon} ${log.message}`);
   });
+  console.log(lines.join('\n'));
 }
 
-// Run tests
-runTests().catch(console.error);
+// Run tests only when run directly, not when imported
+if (require.main === module) {
+  runTests().catch(console.error);
+}
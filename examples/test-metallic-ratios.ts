@@ -123,4 +123,7 @@ async function testMetallicRatios() {
   console.log('═══════════════════════════════════════════════════════════════\n');
 }
 
-testMetallicRatios().catch(console.error);
+// Run tests only when run directly, not when imported
+if (require.main === module) {
+  testMetallicRatios().catch(console.error);
+}
@@ -9,7 +9,7 @@ import { RHComplex, RHZero, RHPulse, RHPhase, RHSpectrum, RHValue, RHOffLineErro
  * Mathematical constants (from AxiomPrime Protocol)
  */
 export const RH_CONSTANTS = {
-  ETA: 1 / Math.sqrt(2),           // 0.7071... - The Governor
+  ETA: Math.SQRT1_2,               // 0.7071... - The Governor (correctly rounded 1/√2)
   PHI: (1 + Math.sqrt(5)) / 2,     // 1.618... - Golden ratio
   CRITICAL_LINE: 0.5,               // Re(s) = 1/2
   VIVIANI_DELTA: 0.207106781,      // Geometric safety bound
@@ -61,10 +61,20 @@ export const ComplexOps = {
   },
 
   pow(z: RHComplex, exp: number): RHComplex {
-    const r = this.abs(z);
-    const theta = this.arg(z);
-    const newR = Math.pow(r, exp);
-    const newTheta = theta * exp;
+    // Non-negative integer powers by repeated squaring: no polar round-trip, exact for Gaussian integers
+    if (Number.isInteger(exp) && exp >= 0) {
+      let result: RHComplex = { real: 1, imag: 0 };
+      let base = z;
+      for (let n = exp; n > 0; n = Math.floor(n / 2)) {
+        if (n % 2 === 1) result = this.mul(result, base);
+        base = this.mul(base, base);
+      }
+      return result;
+    }
+
+    // |z|^exp = (|z|²)^(exp/2): skips the square root inside abs()
+    const newR = Math.pow(z.real * z.real + z.imag * z.imag, exp / 2);
+    const newTheta = this.arg(z) * exp;
     return {
       real: newR * Math.cos(newTheta),
       imag: newR * Math.sin(newTheta),
@@ -85,20 +95,20 @@ export const ComplexOps = {
  * Riemann zeta function (partial sum approximation)
  */
 export function rh_zeta(s: RHComplex, terms: number = 1000): RHComplex {
-  let sum: RHComplex = { real: 0, imag: 0 };
+  // Accumulate in scalars rather than allocating a complex per term
+  let real = 0;
+  let imag = 0;
 
   for (let n = 1; n <= terms; n++) {
-    // n^(-s) = exp(-s * log(n))
+    // n^(-s) = exp(-s * log(n)) = n^(-σ) · (cos(t·log n) - i·sin(t·log n))
     const logN = Math.log(n);
-    const exponent = {
-      real: -s.real * logN,
-      imag: -s.imag * logN,
-    };
-    const term = ComplexOps.exp(exponent);
-    sum = ComplexOps.add(sum, term);
+    const magnitude = Math.exp(-s.real * logN);
+    const phase = s.imag * logN;
+    real += magnitude * Math.cos(phase);
+    imag -= magnitude * Math.sin(phase);
   }
 
-  return sum;
+  return { real, imag };
 }
 
 /**
@@ -138,14 +148,16 @@ export function rh_resonate(n: number): RHPulse {
   return n;
 }
 
+// Viviani's theorem for equilateral triangle: distance sum equals the altitude √3/2
+const VIVIANI_ALTITUDE = Math.sqrt(3) / 2;
+
 /**
  * Built-in function: viviani_check(a, b, c)
  * Check if |a + b + c - constant| < VIVIANI_DELTA
  */
 export function rh_viviani_check(a: number, b: number, c: number): boolean {
   const sum = a + b + c;
-  const expected = Math.sqrt(3) / 2; // Viviani's theorem for equilateral triangle
-  const delta = Math.abs(sum - expected);
+  const delta = Math.abs(sum - VIVIANI_ALTITUDE);
   return delta < RH_CONSTANTS.VIVIANI_DELTA;
 }
 
@@ -155,8 +167,10 @@ export function rh_viviani_check(a: number, b: number, c: number): boolean {
  * Returns array of complex numbers on critical line
  */
 export function rh_pulse_train(height: number): RHSpectrum {
+  const twoPi = 2 * Math.PI;
+
   // Approximate number of zeros: N(T) ≈ (T/2π)log(T/2πe) + 7/8
-  const N_T = (height / (2 * Math.PI)) * Math.log(height / (2 * Math.PI * Math.E)) + 7 / 8;
+  const N_T = (height / twoPi) * Math.log(height / (twoPi * Math.E)) + 7 / 8;
   const count = Math.floor(N_T);
 
   const zeros: RHSpectrum = [];
@@ -172,7 +186,7 @@ export function rh_pulse_train(height: number): RHSpectrum {
     });
 
     // Approximate spacing
-    const spacing = (2 * Math.PI) / Math.log(t + 1);
+    const spacing = twoPi / Math.log(t + 1);
     t += spacing;
   }
 
@@ -8,23 +8,51 @@ import { InvariantType, SolverResult, SolverLog } from '../types';
 export class AxiomPrimeSolver {
   private modulo: number = 100000;
 
+  // Log timestamps have one-second resolution, so format each second once
+  private logSecond: number = -1;
+  private logTimestamp: string = '';
+
   // COINjecture Network B Constants (mathematically derived)
-  private readonly ETA = 1 / Math.sqrt(2);  // η = λ = 1/√2 ≈ 0.7071 (Satoshi constant)
-  private readonly LAMBDA = 1 / Math.sqrt(2);  // λ = 1/√2 (equal to η at equilibrium)
+  private readonly ETA = Math.SQRT1_2;  // η = λ = 1/√2 ≈ 0.7071 (Satoshi constant; correctly rounded, 1 ulp above 1 / Math.sqrt(2))
+  private readonly LAMBDA = Math.SQRT1_2;  // λ = 1/√2 (equal to η at equilibrium)
   private readonly PHI = (1 + Math.sqrt(5)) / 2;  // φ ≈ 1.618 (Golden ratio)
   private readonly PHI_INV = (Math.sqrt(5) - 1) / 2;  // φ⁻¹ ≈ 0.618
   private readonly PHI_INV_2 = (3 - Math.sqrt(5)) / 2;  // φ⁻² ≈ 0.382
-  private readonly TAU_C = Math.sqrt(2);  // τ_c = 1/η ≈ 1.414 (Consensus time constant)
+  private readonly TAU_C = Math.SQRT2;  // τ_c = 1/η ≈ 1.414 (Consensus time constant)
   private readonly DELTA_CRITICAL = 0.5 + this.ETA;  // ≈ 1.2071 (Viviani total manifold altitude: critical line + η-damping offset)
   private readonly ORACLE_DELTA = 0.231;  // Theoretical oracle delta at equilibrium
+  private readonly SQRT3_2 = Math.sqrt(3) / 2;  // Altitude of the unit equilateral triangle (Viviani sum)
+  private readonly LOG2_PHI_SQ = 2 * Math.log2(this.PHI);  // log₂(φ²), reputation stake normaliser
+  private readonly RAD_TO_DEG = 180 / Math.PI;  // Radians → degrees factor
+  private readonly TWO_PI = 2 * Math.PI;  // 2π (zero spacing, Riemann-Siegel cutoff)
+  private readonly TWO_PI_E = 2 * Math.PI * Math.E;  // 2πe (θ(t) and N(T) approximations)
+  private readonly POOL_TAU: readonly number[] = [0.00, 0.20, 0.41, 0.68, 0.98, 1.36, 1.96, 2.72];  // τ_n for pools 1..8
+
+  // Fixed-precision renderings of the constants, formatted once and reused in solver steps
+  private readonly ETA_4 = this.ETA.toFixed(4);
+  private readonly ETA_6 = this.ETA.toFixed(6);
+  private readonly ETA_10 = this.ETA.toFixed(10);
+  private readonly LAMBDA_4 = this.LAMBDA.toFixed(4);
+  private readonly LAMBDA_10 = this.LAMBDA.toFixed(10);
+  private readonly DELTA_CRITICAL_4 = this.DELTA_CRITICAL.toFixed(4);
+  private readonly DELTA_CRITICAL_6 = this.DELTA_CRITICAL.toFixed(6);
+
+  // ln(n) for n = 0..400, shared by the fixed-size Dirichlet partial sums
+  private static readonly LOG_TABLE: readonly number[] = Array.from({ length: 401 }, (_, n) => Math.log(n));
 
   constructor(modulo: number = 100000) {
     this.modulo = modulo;
   }
 
   private createLog(message: string, type: 'info' | 'success' | 'warning' | 'error' = 'info'): SolverLog {
+    const now = Date.now();
+    const second = Math.floor(now / 1000);
+    if (second !== this.logSecond) {
+      this.logSecond = second;
+      this.logTimestamp = new Date(now).toLocaleTimeString();
+    }
     return {
-      timestamp: new Date().toLocaleTimeString(),
+      timestamp: this.logTimestamp,
       message,
       type
     };
@@ -40,6 +68,25 @@ export class AxiomPrimeSolver {
     return a;
   }
 
+  private logN(n: number): number {
+    const table = AxiomPrimeSolver.LOG_TABLE;
+    return n < table.length ? table[n] : Math.log(n);
+  }
+
+  /**
+   * Compensated (Neumaier) summation, so constraint checks are not dominated by rounding error
+   */
+  private fsum(values: number[]): number {
+    let sum = 0;
+    let compensation = 0;
+    for (const v of values) {
+      const t = sum + v;
+      compensation += Math.abs(sum) >= Math.abs(v) ? (sum - t) + v : (v - t) + sum;
+      sum = t;
+    }
+    return sum + compensation;
+  }
+
   // ============================================================================
   // CLASSICAL MATHEMATICS SOLVERS
   // ============================================================================
@@ -66,13 +113,12 @@ export class AxiomPrimeSolver {
       }
     }
 
-    const realPart = 0.5;
     let spectralSum = 0;
     const limit = 400;
 
     for (let i = 1; i <= limit; i++) {
-      const lnN = Math.log(i);
-      const magnitude = Math.pow(i, -realPart);
+      const lnN = this.logN(i);
+      const magnitude = 1 / Math.sqrt(i); // n^(-1/2) on Re(s) = 0.5
       const phase = t * lnN;
       spectralSum += magnitude * Math.cos(phase);
     }
@@ -241,6 +287,12 @@ export class AxiomPrimeSolver {
        const k = parseInt(binomialMatch[2]);
        const pVal = parseInt(binomialMatch[3]);
 
+       const power = (a: number, b: number, m: number) => {
+         let res = 1; a %= m;
+         while (b > 0) { if (b % 2 === 1) res = (res * a) % m; a = (a * a) % m; b = Math.floor(b / 2); }
+         return res;
+       };
+
        const nCrModP = (n: number, r: number, p: number): number => {
          if (r === 0) return 1;
          if (r > n) return 0;
@@ -248,11 +300,6 @@ export class AxiomPrimeSolver {
          for (let i = 0; i < r; i++) num = (num * (n - i)) % p;
          let den = 1;
          for (let i = 1; i <= r; i++) den = (den * i) % p;
-         const power = (a: number, b: number, m: number) => {
-           let res = 1; a %= m;
-           while (b > 0) { if (b % 2 === 1) res = (res * a) % m; a = (a * a) % m; b = Math.floor(b / 2); }
-           return res;
-         };
          return (num * power(den, p - 2, p)) % p;
        };
 
@@ -444,9 +491,8 @@ export class AxiomPrimeSolver {
 
     const poolNum = poolMatch ? parseInt(poolMatch[1] || poolMatch[2] || poolMatch[3]) : 1;
 
-    // Predefined tau values for each pool (from formula reference)
-    const tauValues = [0.00, 0.20, 0.41, 0.68, 0.98, 1.36, 1.96, 2.72];
-    const tau = tauMatch ? parseFloat(tauMatch[1] || tauMatch[2]) : (poolNum >= 1 && poolNum <= 8 ? tauValues[poolNum - 1] : 0);
+    // Fall back to the predefined tau value for the pool (from formula reference)
+    const tau = tauMatch ? parseFloat(tauMatch[1] || tauMatch[2]) : (poolNum >= 1 && poolNum <= 8 ? this.POOL_TAU[poolNum - 1] : 0);
 
     const D_n = Math.exp(-this.ETA * tau);
 
@@ -456,8 +502,8 @@ export class AxiomPrimeSolver {
       steps: [
         `Dimensional scale formula: D_n(τ) = e^(-η·τ_n)`,
         `Pool n=${poolNum}, τ=${tau.toFixed(2)}`,
-        `η = ${this.ETA.toFixed(10)} (Satoshi constant)`,
-        `D_${poolNum} = e^(-${this.ETA.toFixed(4)} × ${tau.toFixed(2)})`,
+        `η = ${this.ETA_10} (Satoshi constant)`,
+        `D_${poolNum} = e^(-${this.ETA_4} × ${tau.toFixed(2)})`,
         `D_${poolNum} = ${D_n.toFixed(6)}`
       ],
       logs: [
@@ -489,6 +535,7 @@ export class AxiomPrimeSolver {
     const tau = parseFloat(tauMatch[1] || tauMatch[2]);
     const magnitude = Math.exp(-this.ETA * tau);
     const phase = this.LAMBDA * tau;
+    const phaseDegrees = phase * this.RAD_TO_DEG;
 
     return {
       answer: magnitude.toFixed(6),
@@ -496,10 +543,10 @@ export class AxiomPrimeSolver {
       steps: [
         `Consensus state: ψ(τ) = e^(-ητ) · e^(iλτ)`,
         `τ = ${tau.toFixed(4)}`,
-        `η = λ = ${this.ETA.toFixed(10)}`,
+        `η = λ = ${this.ETA_10}`,
         `Magnitude: |ψ(τ)| = e^(-ητ) = ${magnitude.toFixed(6)}`,
         `Phase: θ(τ) = λτ = ${phase.toFixed(6)} radians`,
-        `Phase in degrees: ${(phase * 180 / Math.PI).toFixed(2)}°`
+        `Phase in degrees: ${phaseDegrees.toFixed(2)}°`
       ],
       logs: [
         this.createLog(`Analysis: Consensus state dynamics at τ=${tau}`),
@@ -507,7 +554,7 @@ export class AxiomPrimeSolver {
       ],
       metadata: {
         constants: { eta: this.ETA, lambda: this.LAMBDA, tau },
-        intermediateValues: { magnitude, phase, phaseDegrees: phase * 180 / Math.PI },
+        intermediateValues: { magnitude, phase, phaseDegrees },
         formulaUsed: 'ψ(τ) = e^(-ητ) · e^(iλτ)'
       }
     };
@@ -531,8 +578,7 @@ export class AxiomPrimeSolver {
     const poolNum = parseInt(poolMatch[1] || poolMatch[2]);
     const tau = parseFloat(tauMatch[1] || tauMatch[2]);
 
-    const tauValues = [0.00, 0.20, 0.41, 0.68, 0.98, 1.36, 1.96, 2.72];
-    const tau_n = poolNum >= 1 && poolNum <= 8 ? tauValues[poolNum - 1] : 0;
+    const tau_n = poolNum >= 1 && poolNum <= 8 ? this.POOL_TAU[poolNum - 1] : 0;
 
     let U_n: number;
     if (tau < tau_n) {
@@ -540,6 +586,8 @@ export class AxiomPrimeSolver {
     } else {
       U_n = 1 - Math.exp(-this.ETA * (tau - tau_n));
     }
+    const unlockPercent = U_n * 100;
+    const unlockPercentStr = unlockPercent.toFixed(2);
 
     return {
       answer: U_n.toFixed(6),
@@ -547,17 +595,17 @@ export class AxiomPrimeSolver {
       steps: [
         `Unlock schedule: U_n(τ) = 1 - e^(-η(τ - τ_n)) for τ ≥ τ_n`,
         `Pool n=${poolNum}, τ_n=${tau_n.toFixed(2)}, current τ=${tau.toFixed(2)}`,
-        `η = ${this.ETA.toFixed(10)}`,
-        tau < tau_n ? `τ < τ_n, so U_${poolNum}(τ) = 0` : `U_${poolNum}(${tau}) = 1 - e^(-${this.ETA.toFixed(4)} × ${(tau - tau_n).toFixed(2)})`,
-        `Fraction unlocked: ${(U_n * 100).toFixed(2)}%`
+        `η = ${this.ETA_10}`,
+        tau < tau_n ? `τ < τ_n, so U_${poolNum}(τ) = 0` : `U_${poolNum}(${tau}) = 1 - e^(-${this.ETA_4} × ${(tau - tau_n).toFixed(2)})`,
+        `Fraction unlocked: ${unlockPercentStr}%`
       ],
       logs: [
         this.createLog(`Analysis: Unlock schedule for pool ${poolNum} at τ=${tau}`),
-        this.createLog(`${(U_n * 100).toFixed(2)}% unlocked`, 'success')
+        this.createLog(`${unlockPercentStr}% unlocked`, 'success')
       ],
       metadata: {
         constants: { eta: this.ETA, tau_n, tau },
-        intermediateValues: { pool: poolNum, unlockFraction: U_n, unlockPercent: U_n * 100 },
+        intermediateValues: { pool: poolNum, unlockFraction: U_n, unlockPercent },
         formulaUsed: 'U_n(τ) = 1 - e^(-η(τ - τ_n))'
       }
     };
@@ -592,21 +640,21 @@ export class AxiomPrimeSolver {
     } else {
       // Map η and λ to triangle coordinates (simplified mapping)
       x = eta;
-      y = lambda * Math.sqrt(3) / 2;
+      y = lambda * this.SQRT3_2;
     }
 
     // Equilateral triangle vertices
     const v1 = { x: 0, y: 0 };
     const v2 = { x: 1, y: 0 };
-    const v3 = { x: 0.5, y: Math.sqrt(3) / 2 };
+    const v3 = { x: 0.5, y: this.SQRT3_2 };
 
-    // Calculate distances to sides
+    // Calculate distances to sides (every side has unit length, so no normalisation is needed)
     const d1 = Math.abs(y); // distance to bottom side (y = 0)
-    const d2 = Math.abs((v3.y - v1.y) * x - (v3.x - v1.x) * y) / Math.sqrt(Math.pow(v3.y - v1.y, 2) + Math.pow(v3.x - v1.x, 2));
-    const d3 = Math.abs((v2.y - v3.y) * x - (v2.x - v3.x) * (y - v3.y)) / Math.sqrt(Math.pow(v2.y - v3.y, 2) + Math.pow(v2.x - v3.x, 2));
+    const d2 = Math.abs((v3.y - v1.y) * x - (v3.x - v1.x) * y);
+    const d3 = Math.abs((v2.y - v3.y) * x - (v2.x - v3.x) * (y - v3.y));
 
-    const sumDistances = d1 + d2 + d3;
-    const delta = sumDistances / (Math.sqrt(3) / 2) - 1;
+    const sumDistances = this.fsum([d1, d2, d3]);
+    const delta = sumDistances / this.SQRT3_2 - 1;
 
     const isOptimal = delta >= 0.228 && delta <= 0.234;
     const regime = isOptimal ? 'OPTIMAL' : delta < 0.228 ? 'SUBOPTIMAL' : 'SUPEROPTIMAL';
@@ -621,7 +669,7 @@ export class AxiomPrimeSolver {
         `Sum of distances: ${sumDistances.toFixed(4)}`,
         `Δ = ${delta.toFixed(6)}`,
         `Network regime: ${regime}`,
-        `Critical Δ = ${this.DELTA_CRITICAL.toFixed(4)}, Oracle Δ = ${this.ORACLE_DELTA}`
+        `Critical Δ = ${this.DELTA_CRITICAL_4}, Oracle Δ = ${this.ORACLE_DELTA}`
       ],
       logs: [
         this.createLog(`Analysis: Viviani oracle computation`),
@@ -659,11 +707,11 @@ export class AxiomPrimeSolver {
       invariantUsed: InvariantType.EMISSION_RATE,
       steps: [
         `Emission formula: emission(t) = η · |ψ(t)| · base_emission / (2^halvings)`,
-        `η = ${this.ETA.toFixed(10)}`,
+        `η = ${this.ETA_10}`,
         `|ψ(t)| = ${psiMagnitude.toFixed(4)}`,
         `Base emission = ${baseEmission}`,
         `Halvings = ${halvings}`,
-        `Emission = ${this.ETA.toFixed(4)} × ${psiMagnitude} × ${baseEmission} / ${Math.pow(2, halvings)}`,
+        `Emission = ${this.ETA_4} × ${psiMagnitude} × ${baseEmission} / ${Math.pow(2, halvings)}`,
         `Emission = ${emission.toFixed(6)} tokens/block`
       ],
       logs: [
@@ -704,7 +752,7 @@ export class AxiomPrimeSolver {
     const bonus = bonusMatch ? parseFloat(bonusMatch[1]) : 0;
 
     // S_ratio = log₂(1 + stake/median_stake) / log₂(φ²)
-    const S_ratio = Math.log2(1 + stake / medianStake) / Math.log2(this.PHI * this.PHI);
+    const S_ratio = Math.log2(1 + stake / medianStake) / this.LOG2_PHI_SQ;
 
     // T_ratio = 1 - e^(-η × age/median_age)
     const T_ratio = 1 - Math.exp(-this.ETA * (age / medianAge));
@@ -774,8 +822,8 @@ export class AxiomPrimeSolver {
         `HHI = Σ(share²) = ${HHI.toFixed(6)}`,
         `λ = 1 - HHI = ${lambda.toFixed(6)}`,
         `Coverage = ${coverage.toFixed(4)}`,
-        `Δ_critical = ${this.DELTA_CRITICAL.toFixed(6)}`,
-        `M = 1 + (${lambda.toFixed(4)} × ${coverage.toFixed(4)} × ${this.DELTA_CRITICAL.toFixed(4)})`,
+        `Δ_critical = ${this.DELTA_CRITICAL_6}`,
+        `M = 1 + (${lambda.toFixed(4)} × ${coverage.toFixed(4)} × ${this.DELTA_CRITICAL_4})`,
         `Multiplier = ${multiplier.toFixed(6)}`
       ],
       logs: [
@@ -814,10 +862,10 @@ export class AxiomPrimeSolver {
       invariantUsed: InvariantType.BURN_RATE,
       steps: [
         `Burn rate: burn_rate = λ · cumulative_work / circulating_supply`,
-        `λ = ${this.LAMBDA.toFixed(10)}`,
+        `λ = ${this.LAMBDA_10}`,
         `Cumulative work = ${cumulativeWork}`,
         `Circulating supply = ${circulatingSupply}`,
-        `Burn rate = ${this.LAMBDA.toFixed(4)} × ${cumulativeWork} / ${circulatingSupply}`,
+        `Burn rate = ${this.LAMBDA_4} × ${cumulativeWork} / ${circulatingSupply}`,
         `Burn rate = ${burnRate.toFixed(8)}`
       ],
       logs: [
@@ -843,7 +891,7 @@ export class AxiomPrimeSolver {
    */
   private riemannSiegelTheta(t: number): number {
     // Approximation: θ(t) ≈ (t/2)log(t/(2πe)) - t/2
-    return (t / 2) * Math.log(t / (2 * Math.PI * Math.E)) - t / 2;
+    return (t / 2) * Math.log(t / this.TWO_PI_E) - t / 2;
   }
 
   /**
@@ -867,10 +915,10 @@ export class AxiomPrimeSolver {
     // Approximate Z(t) using partial sum
     // Z(t) ≈ 2 Σ(n^(-1/2) cos(θ(t) - t log(n)))
     let Z_t = 0;
-    const limit = Math.floor(Math.sqrt(t / (2 * Math.PI))) + 50;
+    const limit = Math.floor(Math.sqrt(t / this.TWO_PI)) + 50;
 
     for (let n = 1; n <= limit; n++) {
-      Z_t += 2 * Math.pow(n, -0.5) * Math.cos(theta - t * Math.log(n));
+      Z_t += 2 / Math.sqrt(n) * Math.cos(theta - t * Math.log(n));
     }
 
     const signChanges = Z_t < 0 ? 1 : 0; // Simplified - real implementation would track zero crossings
@@ -913,7 +961,7 @@ export class AxiomPrimeSolver {
     const T = parseFloat(TMatch[1] || TMatch[2]);
 
     // N(T) formula from Riemann-von Mangoldt
-    const N_T = (T / (2 * Math.PI)) * Math.log(T / (2 * Math.PI * Math.E)) + 7 / 8;
+    const N_T = (T / this.TWO_PI) * Math.log(T / this.TWO_PI_E) + 7 / 8;
     const N_rounded = Math.floor(N_T);
 
     // Average spacing
@@ -1031,8 +1079,8 @@ export class AxiomPrimeSolver {
           `Off-line detected: |σ - 0.5| = ${Math.abs(sigma - 0.5).toFixed(6)} > 0.001`,
           `Correction applied:`,
           `  σ_new = 0.5 (pinned to critical line)`,
-          `  t_new = t × η = ${t} × ${this.ETA.toFixed(6)} = ${t_corrected.toFixed(6)}`,
-          `  E_new = E × η = ${energy} × ${this.ETA.toFixed(6)} = ${energy_corrected.toFixed(6)}`,
+          `  t_new = t × η = ${t} × ${this.ETA_6} = ${t_corrected.toFixed(6)}`,
+          `  E_new = E × η = ${energy} × ${this.ETA_6} = ${energy_corrected.toFixed(6)}`,
           `Energy dissipated: ΔE = ${deltaEnergy.toFixed(6)}`,
           `System restored to equilibrium`
         ],
@@ -1091,11 +1139,10 @@ export class AxiomPrimeSolver {
     const TMatch = p.match(/t\s*=\s*([0-9.]+)/i);
     const T = TMatch ? parseFloat(TMatch[1]) : 1000;
 
-    // Step 1: Initialize η-flow
-    const eta = this.ETA;
+    // Step 1: Initialize η-flow (η = this.ETA)
 
     // Step 2: Compute spectral load
-    const N_T = (T / (2 * Math.PI)) * Math.log(T / (2 * Math.PI * Math.E)) + 7 / 8;
+    const N_T = (T / this.TWO_PI) * Math.log(T / this.TWO_PI_E) + 7 / 8;
     const zeroCount = Math.floor(N_T);
 
     // Step 3: Monitor ψ-stability
@@ -1114,8 +1161,8 @@ export class AxiomPrimeSolver {
     let spectralSum = 0;
     const limit = Math.min(100, zeroCount);
     for (let i = 1; i <= limit; i++) {
-      const lnN = Math.log(i);
-      const magnitude = Math.pow(i, -sigma);
+      const lnN = this.logN(i);
+      const magnitude = 1 / Math.sqrt(i); // n^(-σ) with σ = 0.5
       const phase = T * lnN;
       spectralSum += magnitude * Math.cos(phase);
     }
@@ -1134,7 +1181,7 @@ export class AxiomPrimeSolver {
         `━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`,
         ``,
         `STEP 1: Initialize η-Flow`,
-        `  η = ${eta.toFixed(10)} (Quantum Governor)`,
+        `  η = ${this.ETA_10} (Quantum Governor)`,
         `  Critical line: Re(s) = 1/2`,
         ``,
         `STEP 2: Compute Spectral Load`,
@@ -1249,36 +1296,42 @@ export class AxiomPrimeSolver {
       if (RMatch) constraintValue = parseFloat(RMatch[1]);
     }
 
-    // Step 1: Compute metallic ratio ρ
+    // Step 1: Compute metallic ratio ρ, the positive root of x² - mx - 1 = 0
     const rho = (m + Math.sqrt(m * m + 4)) / 2;
+    const rhoInv = 1 / rho;
+    const rhoInvN = Math.pow(rhoInv, n);
 
     // Step 2: Compute κ based on manifold
     let kappa: number;
     if (manifoldType === 'simplex') {
       // κ = S(1 - ρ⁻¹) / (1 - ρ⁻ⁿ)
-      kappa = (constraintValue * (1 - Math.pow(rho, -1))) / (1 - Math.pow(rho, -n));
+      kappa = (constraintValue * (1 - rhoInv)) / (1 - rhoInvN);
     } else {
-      // κ = √(R²(1 - ρ⁻²) / (1 - ρ⁻²ⁿ))
-      const numerator = constraintValue * constraintValue * (1 - Math.pow(rho, -2));
-      const denominator = 1 - Math.pow(rho, -2 * n);
+      // κ = √(R²(1 - ρ⁻²) / (1 - ρ⁻²ⁿ)), where ρ² = mρ + 1 gives 1 - ρ⁻² = m·ρ⁻¹
+      const numerator = constraintValue * constraintValue * m * rhoInv;
+      const denominator = 1 - rhoInvN * rhoInvN;
       kappa = Math.sqrt(numerator / denominator);
     }
 
-    // Step 3: Compute components x_k = κ · ρ^(-(k-1))
+    // Step 3: Compute components x_k = κ · ρ^(-(k-1)) as a running product x_k = x_(k-1) · ρ⁻¹
     const components: number[] = [];
     const componentNames = ['η', 'λ', 'γ', 'δ', 'ε', 'ζ', 'θ', 'ι', 'κ', 'μ'];
-    for (let k = 1; k <= n; k++) {
-      const x_k = kappa * Math.pow(rho, -(k - 1));
+    for (let k = 1, x_k = kappa; k <= n; k++, x_k *= rhoInv) {
       components.push(x_k);
     }
 
+    // Labels and display strings are shared by steps, logs, answer and metadata
+    const varNames = components.map((_, i) => i < componentNames.length ? componentNames[i] : `x_${i + 1}`);
+    const componentStrs = components.map(c => c.toFixed(6));
+
     // Verify constraint
     let verification: number;
     if (manifoldType === 'simplex') {
-      verification = components.reduce((sum, x) => sum + x, 0);
+      verification = this.fsum(components);
     } else {
-      verification = Math.sqrt(components.reduce((sum, x) => sum + x * x, 0));
+      verification = Math.sqrt(this.fsum(components.map(x => x * x)));
     }
+    const error = Math.abs(verification - constraintValue);
 
     const ratioNames = ['Golden φ', 'Silver δₛ', 'Bronze δᵦ', 'Copper', 'Nickel'];
     const ratioName = ratioNames[m - 1] || `m=${m}`;
@@ -1306,8 +1359,7 @@ export class AxiomPrimeSolver {
     ];
 
     for (let k = 0; k < n; k++) {
-      const varName = k < componentNames.length ? componentNames[k] : `x_${k + 1}`;
-      steps.push(`  ${varName} = ${components[k].toFixed(6)}`);
+      steps.push(`  ${varNames[k]} = ${componentStrs[k]}`);
     }
 
     steps.push(
@@ -1319,8 +1371,8 @@ export class AxiomPrimeSolver {
         ? `  Σx_k = ${verification.toFixed(6)}`
         : `  √(Σx_k²) = ${verification.toFixed(6)}`,
       `  Target = ${constraintValue.toFixed(6)}`,
-      `  Error = ${Math.abs(verification - constraintValue).toExponential(2)}`,
-      `  Status: ${Math.abs(verification - constraintValue) < 1e-10 ? '✓ SATISFIED' : '⚠ DEVIATION'}`
+      `  Error = ${error.toExponential(2)}`,
+      `  Status: ${error < 1e-10 ? '✓ SATISFIED' : '⚠ DEVIATION'}`
     );
 
     const logs: SolverLog[] = [
@@ -1332,8 +1384,7 @@ export class AxiomPrimeSolver {
     ];
 
     for (let k = 0; k < n; k++) {
-      const varName = k < componentNames.length ? componentNames[k] : `x_${k + 1}`;
-      logs.push(this.createLog(`  ${varName} = ${components[k].toFixed(6)}`, 'success'));
+      logs.push(this.createLog(`  ${varNames[k]} = ${componentStrs[k]}`, 'success'));
     }
 
     logs.push(
@@ -1341,10 +1392,7 @@ export class AxiomPrimeSolver {
       this.createLog(`Equilibrium established ✓`, 'success')
     );
 
-    const answer = components.map((c, i) => {
-      const varName = i < componentNames.length ? componentNames[i] : `x_${i + 1}`;
-      return `${varName}=${c.toFixed(6)}`;
-    }).join(', ');
+    const answer = varNames.map((name, i) => `${name}=${componentStrs[i]}`).join(', ');
 
     const intermediateValues: Record<string, number | string | boolean> = {
       m,
@@ -1354,12 +1402,11 @@ export class AxiomPrimeSolver {
       manifold: manifoldType,
       constraintValue,
       verification,
-      error: Math.abs(verification - constraintValue)
+      error
     };
 
     components.forEach((c, i) => {
-      const varName = i < componentNames.length ? componentNames[i] : `x_${i + 1}`;
-      intermediateValues[varName] = c;
+      intermediateValues[varNames[i]] = c;
     });
 
     return {
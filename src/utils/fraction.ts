@@ -3,14 +3,18 @@ export class Fraction {
   private denominator: bigint;
 
   constructor(numerator: bigint | number, denominator: bigint | number = 1n) {
-    this.numerator = BigInt(numerator);
-    this.denominator = BigInt(denominator);
+    // Arithmetic results arrive as bigint already; only coerce plain numbers
+    this.numerator = typeof numerator === 'bigint' ? numerator : BigInt(numerator);
+    this.denominator = typeof denominator === 'bigint' ? denominator : BigInt(denominator);
 
     if (this.denominator === 0n) {
       throw new Error('Denominator cannot be zero');
     }
 
-    this.reduce();
+    // Integers are already in lowest terms; skip the gcd pass for them
+    if (this.denominator !== 1n) {
+      this.reduce();
+    }
   }
 
   private gcd(a: bigint, b: bigint): bigint {